@@ -2,11 +2,11 @@
 Card implementation for Scoundrel.
 """
 from enum import Enum
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 
 
-class Suit(Enum):
+class Suit(str, Enum):
     CLUBS = "♣"    # Monsters
     SPADES = "♠"   # Monsters
     DIAMONDS = "♦" # Weapons
@@ -19,61 +19,71 @@ class CardType(Enum):
     POTION = "Potion"
 
 
-@dataclass
+_SUIT_TO_TYPE = {
+    Suit.CLUBS: CardType.MONSTER,
+    Suit.SPADES: CardType.MONSTER,
+    Suit.DIAMONDS: CardType.WEAPON,
+    Suit.HEARTS: CardType.POTION,
+}
+
+_FACE_CARD_NAMES = {
+    11: "J",
+    12: "Q",
+    13: "K",
+    14: "A",
+}
+
+
+@dataclass(frozen=True, slots=True)
 class Card:
     suit: Suit
     value: int
+    type: CardType = field(init=False, repr=False, compare=False)
+    name: str = field(init=False, repr=False, compare=False)
     
-    @property
-    def type(self) -> CardType:
-        if self.suit in [Suit.CLUBS, Suit.SPADES]:
-            return CardType.MONSTER
-        elif self.suit == Suit.DIAMONDS:
-            return CardType.WEAPON
-        else:  # Hearts
-            return CardType.POTION
-    
-    @property
-    def name(self) -> str:
-        # Convert number to face card name if applicable
-        if self.value <= 10:
-            card_name = str(self.value)
-        elif self.value == 11:
-            card_name = "J"
-        elif self.value == 12:
-            card_name = "Q"
-        elif self.value == 13:
-            card_name = "K"
-        else:  # value == 14
-            card_name = "A"
+    def __post_init__(self):
+        # The type and name only depend on the suit and value, so resolve them once up front
+        object.__setattr__(self, "type", _SUIT_TO_TYPE[self.suit])
         
-        return f"{card_name}{self.suit.value}"
+        # Convert number to face card name if applicable
+        card_name = _FACE_CARD_NAMES.get(self.value, str(self.value))
+        object.__setattr__(self, "name", f"{card_name}{self.suit.value}")
     
     def __str__(self) -> str:
         return self.name
 
 
+def _build_standard_deck() -> Tuple[Card, ...]:
+    """Build the Scoundrel deck (44 cards):
+    - Complete set of clubs and spades (A-K)
+    - Diamonds 2-10
+    - Hearts 2-10
+    """
+    # Add clubs and spades (including face cards and aces)
+    monsters = tuple(Card(suit, value)
+                     for suit in (Suit.CLUBS, Suit.SPADES)
+                     for value in range(2, 15))  # 2-14 (Ace is 14)
+    
+    # Add diamonds and hearts (2-10 only)
+    others = tuple(Card(suit, value)
+                   for suit in (Suit.DIAMONDS, Suit.HEARTS)
+                   for value in range(2, 11))  # 2-10
+    
+    return monsters + others
+
+
+# Cards are immutable, so every deck can share the same instances
+_STANDARD_DECK: Tuple[Card, ...] = _build_standard_deck()
+
+
 class Deck:
     def __init__(self):
         """Initialize a standard modified deck for Scoundrel."""
-        self.cards: List[Card] = []
-        self._build_deck()
-    
-    def _build_deck(self):
-        """Build the Scoundrel deck (44 cards):
-        - Complete set of clubs and spades (A-K)
-        - Diamonds 2-10
-        - Hearts 2-10
-        """
-        # Add clubs and spades (including face cards and aces)
-        for suit in [Suit.CLUBS, Suit.SPADES]:
-            for value in range(2, 15):  # 2-14 (Ace is 14)
-                self.cards.append(Card(suit, value))
-        
-        # Add diamonds and hearts (2-10 only)
-        for suit in [Suit.DIAMONDS, Suit.HEARTS]:
-            for value in range(2, 11):  # 2-10
-                self.cards.append(Card(suit, value))
+        self.cards: List[Card] = list(_STANDARD_DECK)
+
+
+# Weapon threshold that lets a fresh weapon defeat any monster (Ace = 14)
+_ANY_MONSTER_THRESHOLD = 15
 
 
 @dataclass
@@ -81,6 +91,12 @@ class Weapon:
     """Represents an equipped weapon."""
     card: Card
     last_monster_defeated: Optional[Card] = None
+    # Monsters must be strictly below this value to be defeated with the weapon
+    threshold: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.threshold = (_ANY_MONSTER_THRESHOLD if self.last_monster_defeated is None
+                          else self.last_monster_defeated.value)
     
     @property
     def value(self) -> int:
@@ -88,9 +104,11 @@ class Weapon:
     
     def can_defeat(self, monster: Card) -> bool:
         """Check if this weapon can defeat the given monster."""
-        if self.last_monster_defeated is None:
-            # First use: can defeat any monster
-            return True
-        
+        # First use: can defeat any monster
         # Subsequent use: can only defeat monsters with value lower than last monster
-        return monster.value < self.last_monster_defeated.value
\ No newline at end of file
+        return monster.value < self.threshold
+    
+    def record_defeat(self, monster: Card) -> None:
+        """Record a monster defeated with this weapon."""
+        self.last_monster_defeated = monster
+        self.threshold = monster.value
@@ -2,9 +2,14 @@
 Game implementation for Scoundrel.
 """
 import random
-from typing import List, Optional, Tuple
+from collections import deque
+from typing import Deque, List, Optional, Tuple
 
-from .card import Card, CardType, Deck, Weapon
+from .card import _STANDARD_DECK, Card, CardType, Weapon
+
+
+# Number of card slots in a room
+ROOM_SIZE = 4
 
 
 class GameState:
@@ -14,14 +19,15 @@ class GameState:
         self.player_health: int = 20
         self.max_health: int = 20
         self.equipped_weapon: Optional[Weapon] = None
-        self.current_room: List[Card] = []
-        self.dungeon: List[Card] = []
+        self.current_room: List[Optional[Card]] = [None] * ROOM_SIZE
+        self.dungeon: Deque[Card] = deque()
         self.discard: List[Card] = []
         self.ran_last_room: bool = False
         self.potion_used_this_room: bool = False
         self.game_over: bool = False
         self.victory: bool = False
         self.cards_played_this_room: int = 0
+        self._monsters_remaining: int = 0
         
         # Initialize the dungeon
         self._setup_dungeon()
@@ -30,40 +36,31 @@ class GameState:
         self.deal_room()
     
     def _setup_dungeon(self):
-        """Set up the dungeon deck by creating and shuffling the cards."""
-        deck = Deck()
-        self.dungeon = deck.cards.copy()
-        random.shuffle(self.dungeon)
+        """Set up the dungeon deck by copying and shuffling the standard deck."""
+        cards = list(_STANDARD_DECK)
+        random.shuffle(cards)
+        # Cards are drawn from the front, so keep the dungeon in a deque
+        self.dungeon = deque(cards)
+        
+        # Count the monsters once; afterwards the count is kept up to date as they are fought
+        self._monsters_remaining = sum(1 for card in cards if card.type is CardType.MONSTER)
     
     def deal_room(self):
-        """Deal 4 cards to form a new room. Keep one card from previous room if available."""
+        """Deal cards into the empty slots of the room. A card kept from the previous room stays in its slot."""
         # Reset room state
         self.potion_used_this_room = False
         self.cards_played_this_room = 0
         
-        # If this is not the first room, keep one card
-        kept_card = None
-        if self.current_room:
-            kept_card = self.current_room[0]
-            self.current_room = []
-        
-        # Add the kept card if there was one
-        if kept_card:
-            self.current_room.append(kept_card)
-        
-        # Deal cards until we have 4 in the room
-        cards_to_deal = 4 - len(self.current_room)
-        if cards_to_deal > len(self.dungeon):
-            # Not enough cards left in the dungeon
-            self.current_room.extend(self.dungeon)
-            self.dungeon = []
-            self._check_victory()
-        else:
-            for _ in range(cards_to_deal):
-                self.current_room.append(self.dungeon.pop(0))
+        # Deal cards until all slots are filled
+        for i, card in enumerate(self.current_room):
+            if card is None:
+                if not self.dungeon:
+                    # Not enough cards left in the dungeon
+                    break
+                self.current_room[i] = self.dungeon.popleft()
     
     def run_from_room(self) -> bool:
-        """Handle running mechanic. Return False if running is not allowed."""
+        """Handle running mechanic. Return False, leaving the room untouched, if running is not allowed."""
         if self.ran_last_room:
             return False
         
@@ -71,8 +68,8 @@ class GameState:
             return False
         
         # Put current room cards at the bottom of the dungeon
-        self.dungeon.extend(self.current_room)
-        self.current_room = []
+        self.dungeon.extend(card for card in self.current_room if card is not None)
+        self.current_room = [None] * ROOM_SIZE
         
         # Set ran_last_room flag
         self.ran_last_room = True
@@ -98,25 +95,29 @@ class GameState:
             return "Invalid card index.", False
         
         card = self.current_room[card_index]
+        if card is None:
+            return "Invalid card index.", False
+        
         message = ""
         
         # Process the card based on its type
-        if card.type == CardType.MONSTER:
+        if card.type is CardType.MONSTER:
             message = self._handle_monster(card, use_weapon)
-        elif card.type == CardType.WEAPON:
+        elif card.type is CardType.WEAPON:
             message = self._handle_weapon(card)
-        elif card.type == CardType.POTION:
+        elif card.type is CardType.POTION:
             message = self._handle_potion(card)
         
-        # Remove the card from the room and add to discard
-        self.current_room.pop(card_index)
+        # Empty the card's slot and add it to discard
+        self.current_room[card_index] = None
         self.discard.append(card)
         
         # Increment cards played this room
         self.cards_played_this_room += 1
         
         # Check if we need to deal a new room
-        if self.cards_played_this_room >= 3 and len(self.current_room) == 1:
+        cards_left = sum(1 for slot in self.current_room if slot is not None)
+        if self.cards_played_this_room >= 3 and cards_left == 1:
             self.ran_last_room = False  # Reset the ran_last_room flag
             self.deal_room()
             message += " You enter a new room."
@@ -149,11 +150,14 @@ class GameState:
             damage = max(0, monster.value - weapon_value)
             weapon_used = True
             # Update the last monster defeated with this weapon
-            self.equipped_weapon.last_monster_defeated = monster
+            self.equipped_weapon.record_defeat(monster)
         
         # Apply damage
         self.player_health -= damage
         
+        # The monster is resolved and will be discarded
+        self._monsters_remaining -= 1
+        
         # Check for game over
         if self.player_health <= 0:
             self.game_over = True
@@ -166,6 +170,9 @@ class GameState:
                 return f"You fought {monster} barehanded. " \
                        f"You took {damage} damage and were defeated!"
         
+        # Check for victory now that the monster count has changed
+        self._check_victory()
+        
         if weapon_used:
             return f"You fought {monster} with your {self.equipped_weapon.card}. " \
                    f"You took {damage} damage."
@@ -206,32 +213,10 @@ class GameState:
     
     def _check_victory(self):
         """Check for victory condition (all monster cards defeated)."""
-        # Check if any monster cards remain in the dungeon
-        for card in self.dungeon:
-            if card.type == CardType.MONSTER:
-                return
-        
-        # If no monster cards remain in the dungeon, check the current room
-        for card in self.current_room:
-            if card.type == CardType.MONSTER:
-                return
-                
-        # No monster cards remain, player wins
-        self.game_over = True
-        self.victory = True
+        if self._monsters_remaining == 0:
+            self.game_over = True
+            self.victory = True
     
     def get_remaining_monster_count(self) -> int:
         """Get the count of remaining monster cards in the game."""
-        count = 0
-        
-        # Count monsters in the dungeon
-        for card in self.dungeon:
-            if card.type == CardType.MONSTER:
-                count += 1
-        
-        # Count monsters in the current room
-        for card in self.current_room:
-            if card.type == CardType.MONSTER:
-                count += 1
-                
-        return count
\ No newline at end of file
+        return self._monsters_remaining
@@ -1,11 +1,11 @@
 """
 Terminal UI implementation for Scoundrel using Textual.
 """
-from typing import List, Dict, Any
+from collections import deque
+from typing import Dict, Any, Deque, Optional
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Button, Static, Label, Footer, Header, OptionList
-from textual.reactive import reactive
 from textual.binding import Binding
 from textual import events
 from textual.widgets.option_list import Option
@@ -17,25 +17,45 @@ from ..game.game import GameState
 from ..game.card import Card, CardType
 
 
+# CSS classes for each card type
+_CARD_CLASSES = {
+    CardType.MONSTER: "card monster",
+    CardType.WEAPON: "card weapon",
+    CardType.POTION: "card potion",
+}
+
+
 class CardWidget(Button):
     """A widget that displays a card."""
     
-    def __init__(self, card: Card, index: int, **kwargs):
+    def __init__(self, card: Optional[Card], index: int, **kwargs):
         self.card = card
         self.index = index
         
-        # Set card classes based on card type
-        if card.type == CardType.MONSTER:
-            if card.suit.value == "♣":  # Clubs
-                style = "card monster"
-            else:  # Spades
-                style = "card monster"
-        elif card.type == CardType.WEAPON:
-            style = "card weapon"
-        else:  # Potion
-            style = "card potion"
+        label = str(card) if card else ""
+        super().__init__(label, id=f"card_{index}", classes=self._card_classes(card), **kwargs)
+        self.display = card is not None
+    
+    @staticmethod
+    def _card_classes(card: Optional[Card]) -> str:
+        """Get the CSS classes for the given card."""
+        if card is None:
+            return "card"
+        return _CARD_CLASSES[card.type]
+    
+    def set_card(self, card: Optional[Card]) -> None:
+        """Show a different card in this slot, hiding the slot if there is no card."""
+        if card is None:
+            self.card = None
+            self.display = False
+            return
         
-        super().__init__(str(card), id=f"card_{index}", classes=style, **kwargs)
+        if card != self.card:
+            self.card = card
+            self.label = str(card)
+            self.remove_class("monster", "weapon", "potion")
+            self.add_class(*self._card_classes(card).split())
+        self.display = True
 
 
 class RoomDisplay(Container):
@@ -48,8 +68,28 @@ class RoomDisplay(Container):
     def compose(self) -> ComposeResult:
         """Compose the card widgets."""
         with Horizontal(id="room_cards"):
+            # One fixed slot per room slot; empty slots are hidden
             for i, card in enumerate(self.game_state.current_room):
                 yield CardWidget(card, i)
+        
+        message = Label(id="room_message")
+        message.display = False
+        yield message
+    
+    def update_room(self):
+        """Update the card slots to match the current room."""
+        room = self.game_state.current_room
+        for widget in self.query(CardWidget):
+            widget.set_card(room[widget.index])
+        self.query_one("#room_message", Label).display = False
+    
+    def show_message(self, message: str):
+        """Hide the cards and show a message in their place."""
+        for widget in self.query(CardWidget):
+            widget.set_card(None)
+        room_message = self.query_one("#room_message", Label)
+        room_message.update(message)
+        room_message.display = True
 
 
 class StatusDisplay(Container):
@@ -61,16 +101,22 @@ class StatusDisplay(Container):
     
     def compose(self) -> ComposeResult:
         """Compose the status display."""
-        yield Label(id="health_display", classes="status_item")
-        yield Label(id="weapon_display", classes="status_item")
-        yield Label(id="room_status", classes="status_item")
-        yield Label(id="monsters_left", classes="status_item")
+        # Keep references to the labels so updates don't have to query for them
+        self._health_label = Label(id="health_display", classes="status_item")
+        self._weapon_label = Label(id="weapon_display", classes="status_item")
+        self._room_status_label = Label(id="room_status", classes="status_item")
+        self._monsters_label = Label(id="monsters_left", classes="status_item")
+        
+        yield self._health_label
+        yield self._weapon_label
+        yield self._room_status_label
+        yield self._monsters_label
     
     def update_status(self):
         """Update all status displays."""
         # Update health display
         health_text = f"Health: {self.game_state.player_health}/{self.game_state.max_health}"
-        self.query_one("#health_display", Label).update(health_text)
+        self._health_label.update(health_text)
         
         # Update weapon display
         if self.game_state.equipped_weapon:
@@ -81,7 +127,7 @@ class StatusDisplay(Container):
                 weapon_text = f"Weapon: {weapon.card} (can defeat any monster)"
         else:
             weapon_text = "Weapon: None"
-        self.query_one("#weapon_display", Label).update(weapon_text)
+        self._weapon_label.update(weapon_text)
         
         # Update room status display
         status_items = []
@@ -91,29 +137,26 @@ class StatusDisplay(Container):
             status_items.append("Potion Used")
         
         status_text = f"Status: {', '.join(status_items) if status_items else 'None'}"
-        self.query_one("#room_status", Label).update(status_text)
+        self._room_status_label.update(status_text)
         
         # Update monsters left display
         monsters_left = self.game_state.get_remaining_monster_count()
         monsters_text = f"Monsters Left: {monsters_left}"
-        self.query_one("#monsters_left", Label).update(monsters_text)
+        self._monsters_label.update(monsters_text)
 
 
 class MessageLog(Static):
     """A widget that displays game messages."""
     
-    messages: reactive[List[str]] = reactive([])
-    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.messages = []
+        # Keep only the last 5 messages
+        self.messages: Deque[str] = deque(maxlen=5)
     
     def add_message(self, message: str):
         """Add a message to the log."""
         self.messages.append(message)
-        # Keep only the last 5 messages
-        if len(self.messages) > 5:
-            self.messages = self.messages[-5:]
+        self.refresh()
     
     def render(self) -> RenderableType:
         """Render the message log."""
@@ -236,14 +279,16 @@ class ScoundrelApp(App):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.game_state = GameState()
+        self._widget_seq = 0
+        self._combat_dialog: Optional[Container] = None
     
     def compose(self) -> ComposeResult:
         """Compose the application UI."""
         yield Header(show_clock=True)
         
         with Container(id="game_container"):
-            # Room display - create an empty container for the room
-            yield Container(id="room_display")
+            # Room display
+            yield RoomDisplay(self.game_state, id="room_display")
             
             # Status display
             yield StatusDisplay(self.game_state, id="status_display")
@@ -258,48 +303,41 @@ class ScoundrelApp(App):
         
         yield Footer()
     
+    def _next_id(self, prefix: str) -> str:
+        """Generate a unique widget ID with the given prefix."""
+        self._widget_seq += 1
+        return f"{prefix}_{self._widget_seq}"
+    
     def on_mount(self) -> None:
         """Event handler called when the app is mounted."""
         self.update_ui()
     
     def update_ui(self):
         """Update all UI elements."""
-        # Re-render the room - clear and create a new room display with a dynamic ID
-        room_container = self.query_one("#room_display")
-        room_container.remove_children()  # Clear any existing children first
-        
-        # Create a unique ID for the room display using timestamp
-        import time
-        unique_id = f"room_{int(time.time() * 1000)}"
-        room_container.mount(RoomDisplay(self.game_state, id=unique_id))
-        
-        # Update status display
-        self.query_one(StatusDisplay).update_status()
-        
-        # Update run button state
-        run_button = self.query_one("#run_button", Button)
-        if self.game_state.ran_last_room or self.game_state.cards_played_this_room > 0:
-            run_button.disabled = True
-        else:
-            run_button.disabled = False
-        
-        # Check for game over
-        if self.game_state.game_over:
-            self.show_game_over()
+        # Apply all the changes in a single refresh
+        with self.batch_update():
+            # Update the room display in place
+            self.query_one(RoomDisplay).update_room()
+            
+            # Update status display
+            self.query_one(StatusDisplay).update_status()
+            
+            # Update run button state
+            run_button = self.query_one("#run_button", Button)
+            if self.game_state.ran_last_room or self.game_state.cards_played_this_room > 0:
+                run_button.disabled = True
+            else:
+                run_button.disabled = False
+            
+            # Check for game over
+            if self.game_state.game_over:
+                self.show_game_over()
     
     def show_game_over(self):
         """Display the game over screen."""
-        # Clear the room
-        room_container = self.query_one("#room_display")
-        room_container.remove_children()
-        
-        # Display game over message
+        # Display game over message in place of the room
         message = "Victory! You've defeated all monsters!" if self.game_state.victory else "Game Over! You were defeated!"
-        
-        # Use a unique ID for the game over message
-        import time
-        unique_id = f"game_over_message_{int(time.time() * 1000)}"
-        room_container.mount(Label(message, id=unique_id))
+        self.query_one(RoomDisplay).show_message(message)
         
         # Disable run button
         self.query_one("#run_button", Button).disabled = True
@@ -307,12 +345,7 @@ class ScoundrelApp(App):
     def show_combat_options(self, card_index: int) -> None:
         """Show a combat options dialog for fighting a monster."""
         # First, remove any existing combat dialog
-        try:
-            existing_dialog = self.query_one("#combat_dialog")
-            if existing_dialog:
-                existing_dialog.remove()
-        except Exception:
-            pass  # No dialog exists yet
+        self._close_combat_dialog()
         
         # Store the card index for later use
         self._combat_card_index = card_index
@@ -330,9 +363,8 @@ class ScoundrelApp(App):
         if weapon:
             can_use_weapon = weapon.can_defeat(monster)
         
-        # Generate a unique ID using timestamp to avoid conflicts
-        import time
-        unique_id = f"combat_dialog_{int(time.time() * 1000)}"
+        # Generate a unique ID to avoid conflicts
+        unique_id = self._next_id("combat_dialog")
         
         # First mount the container to the app - mount to main container for proper positioning
         with self.batch_update():
@@ -376,28 +408,24 @@ class ScoundrelApp(App):
             # Add options after the list is mounted
             options.add_options(combat_options)
             
-            # Save the dialog ID for later reference
-            self._current_dialog_id = unique_id
+            # Keep the dialog for later reference
+            self._combat_dialog = combat_dialog
             
             # Register handler for option selection
             options.focus()
     
+    def _close_combat_dialog(self) -> None:
+        """Remove the combat dialog if one is open."""
+        if self._combat_dialog is not None:
+            self._combat_dialog.remove()
+            self._combat_dialog = None
+    
     def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         """Handle option selection for combat dialog."""
         option_id = event.option.id
         
-        # Remove the dialog using the saved unique ID
-        try:
-            # Use the stored dialog ID from show_combat_options
-            if hasattr(self, '_current_dialog_id'):
-                dialog_id = self._current_dialog_id
-                # Find dialog within game_container
-                game_container = self.query_one("#game_container")
-                dialog = game_container.query_one(f"#{dialog_id}")
-                if dialog:
-                    dialog.remove()
-        except Exception:
-            pass
+        # Remove the dialog opened by show_combat_options
+        self._close_combat_dialog()
         
         # Process the selected option
         if option_id == "use_weapon":
@@ -424,9 +452,8 @@ class ScoundrelApp(App):
             
             # If this is a monster card, ask if they want to use weapon
             card = self.game_state.current_room[card_index]
-            from ..game.card import CardType
             
-            if card.type == CardType.MONSTER and self.game_state.equipped_weapon:
+            if card.type is CardType.MONSTER and self.game_state.equipped_weapon:
                 # Show combat options dialog
                 self.show_combat_options(card_index)
             else:
@@ -448,8 +475,10 @@ class ScoundrelApp(App):
     def action_new_game(self) -> None:
         """New game action handler."""
         self.game_state = GameState()
+        self.query_one(RoomDisplay).game_state = self.game_state
+        self.query_one(StatusDisplay).game_state = self.game_state
         message_log = self.query_one(MessageLog)
-        message_log.messages = []
+        message_log.messages.clear()
         message_log.add_message("New game started!")
         self.update_ui()
     
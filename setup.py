@@ -16,5 +16,5 @@ setup(
     author_email="example@example.com",
     description="A terminal-based implementation of the Scoundrel card game",
     keywords="game, card-game, tui, terminal",
-    python_requires=">=3.7",
+    python_requires=">=3.10",
 )
\ No newline at end of file
@@ -2,9 +2,14 @@
 Tests for the card module functionality.
 """
 import unittest
+from collections import Counter
 from scoundrelc.game.card import Card, Suit, CardType, Deck, Weapon
 
 
+# Suits that only go up to 10 in the Scoundrel deck
+_RED = frozenset({Suit.DIAMONDS, Suit.HEARTS})
+
+
 class TestCard(unittest.TestCase):
     """Test cases for the Card class."""
     
@@ -50,35 +55,46 @@ class TestCard(unittest.TestCase):
 class TestDeck(unittest.TestCase):
     """Test cases for the Deck class."""
     
+    @classmethod
+    def setUpClass(cls):
+        # The tests only read the cards, so they can share one deck
+        cls.deck = Deck()
+    
     def test_deck_size(self):
         """Test that the deck has the correct number of cards."""
-        deck = Deck()
+        deck = self.deck
         # The Scoundrel deck should have 44 cards
         self.assertEqual(len(deck.cards), 44)
     
     def test_deck_composition(self):
         """Test that the deck has the correct composition of cards."""
-        deck = Deck()
+        deck = self.deck
         
         # Count cards by suit
-        clubs = sum(1 for card in deck.cards if card.suit == Suit.CLUBS)
-        spades = sum(1 for card in deck.cards if card.suit == Suit.SPADES)
-        diamonds = sum(1 for card in deck.cards if card.suit == Suit.DIAMONDS)
-        hearts = sum(1 for card in deck.cards if card.suit == Suit.HEARTS)
+        counts = Counter(card.suit for card in deck.cards)
         
         # There should be 13 of each clubs and spades (2-A)
-        self.assertEqual(clubs, 13)
-        self.assertEqual(spades, 13)
+        self.assertEqual(counts[Suit.CLUBS], 13)
+        self.assertEqual(counts[Suit.SPADES], 13)
         
         # There should be 9 of each diamonds and hearts (2-10)
-        self.assertEqual(diamonds, 9)
-        self.assertEqual(hearts, 9)
+        self.assertEqual(counts[Suit.DIAMONDS], 9)
+        self.assertEqual(counts[Suit.HEARTS], 9)
         
         # Verify no face cards in diamonds and hearts
-        for card in deck.cards:
-            if card.suit in [Suit.DIAMONDS, Suit.HEARTS]:
-                self.assertTrue(2 <= card.value <= 10, 
-                                f"Card {card} has invalid value for diamonds/hearts")
+        invalid_cards = [card for card in deck.cards
+                         if card.suit in _RED and not 2 <= card.value <= 10]
+        self.assertEqual(invalid_cards, [], "Diamonds/hearts cards with invalid values")
+    
+    def test_decks_are_independent(self):
+        """Test that each deck gets its own list of cards."""
+        other_deck = Deck()
+        other_deck.cards.pop()
+        
+        # Changing one deck should not affect the shared deck
+        self.assertIsNot(other_deck.cards, self.deck.cards)
+        self.assertEqual(len(self.deck.cards), 44)
+        self.assertEqual(len(Deck().cards), 44)
 
 
 class TestWeapon(unittest.TestCase):
@@ -105,7 +121,7 @@ class TestWeapon(unittest.TestCase):
         
         # First defeat a monster
         medium_monster = Card(Suit.CLUBS, 10)
-        weapon.last_monster_defeated = medium_monster
+        weapon.record_defeat(medium_monster)
         
         # Now the weapon should only be able to defeat monsters weaker than value 10
         weak_monster = Card(Suit.SPADES, 9)
@@ -115,6 +131,22 @@ class TestWeapon(unittest.TestCase):
         self.assertTrue(weapon.can_defeat(weak_monster))
         self.assertFalse(weapon.can_defeat(equal_monster))
         self.assertFalse(weapon.can_defeat(strong_monster))
+    
+    def test_weapon_threshold(self):
+        """Test that the weapon threshold follows the last monster defeated."""
+        weapon = Weapon(Card(Suit.DIAMONDS, 6))
+        
+        # A fresh weapon can defeat even an Ace
+        self.assertGreater(weapon.threshold, 14)
+        
+        # Recording a defeated monster lowers the threshold to its value
+        weapon.record_defeat(Card(Suit.CLUBS, 9))
+        self.assertEqual(weapon.threshold, 9)
+        
+        # A weapon created with a previous defeat starts with that threshold
+        used_weapon = Weapon(Card(Suit.DIAMONDS, 6), Card(Suit.SPADES, 4))
+        self.assertEqual(used_weapon.threshold, 4)
+        self.assertFalse(used_weapon.can_defeat(Card(Suit.CLUBS, 4)))
 
 
 if __name__ == '__main__':
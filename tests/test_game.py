@@ -1,18 +1,75 @@
 """
 Tests for the game module functionality.
 """
+import copy
 import unittest
-from unittest.mock import patch, MagicMock
-from scoundrelc.game.game import GameState
+from collections import deque
+from unittest.mock import patch
+from scoundrelc.game.game import GameState, ROOM_SIZE
 from scoundrelc.game.card import Card, Suit, CardType, Weapon
 
 
-class TestGameState(unittest.TestCase):
-    """Test cases for the GameState class."""
+DECK_TOTAL = 44
+DUNGEON_SIZE = DECK_TOTAL - ROOM_SIZE
+
+# (weapon value, monster value, last monster defeated, use weapon, expected damage)
+MONSTER_DAMAGE_CASES = [
+    (None, 5, None, False, 5),   # Barehanded takes full damage
+    (None, 7, None, True, 7),    # No weapon to use takes full damage
+    (3, 5, None, True, 2),       # Weapon reduces damage
+    (2, 14, None, True, 12),     # First use can defeat any monster
+    (9, 8, 10, True, 0),         # Damage never goes below zero
+    (7, 11, 10, True, 11),       # Stronger than last defeated: full damage
+    (7, 7, 7, True, 7),          # Equal to last defeated: full damage
+    (8, 7, 5, False, 7),         # Choosing to fight barehanded: full damage
+]
+
+
+class TestGameStateNoShuffle(unittest.TestCase):
+    """Test cases for setting up a GameState with shuffling disabled."""
+
+    def setUp(self):
+        shuffle_patcher = patch('random.shuffle')
+        self.mock_shuffle = shuffle_patcher.start()
+        self.addCleanup(shuffle_patcher.stop)
+
+    def test_setup_dungeon(self):
+        """Test that the dungeon is set up correctly."""
+        game = GameState()
+        
+        # The dungeon should be a deque to draw from
+        self.assertIsInstance(game.dungeon, deque)
+        
+        # Verify random.shuffle was called
+        self.mock_shuffle.assert_called_once()
+
+    def test_first_room_unshuffled(self):
+        """Test that the first room is dealt from the top of the dungeon."""
+        game = GameState()
+        
+        # Without shuffling the deck starts with the clubs in order
+        self.assertEqual(game.current_room, [Card(Suit.CLUBS, value) for value in range(2, 6)])
+        self.assertEqual(game.dungeon[0], Card(Suit.CLUBS, 6))
+
+
+class GameStateTestCase(unittest.TestCase):
+    """Base class giving each test its own copy of a shared GameState."""
+
+    @classmethod
+    def setUpClass(cls):
+        # Build one game per class and give each test its own copy of it
+        cls._template = GameState()
+
+    def setUp(self):
+        self.game = copy.deepcopy(self._template)
+
+
+class TestDealRoom(GameStateTestCase):
+    """Test cases for dealing rooms and playing cards from them."""
 
     def test_init(self):
         """Test that the game state is initialized correctly."""
-        game = GameState()
+        game = self.game
         
         # Check initial player state
         self.assertEqual(game.player_health, 20)
@@ -20,7 +77,8 @@ class TestGameState(unittest.TestCase):
         self.assertIsNone(game.equipped_weapon)
         
         # Check room setup
-        self.assertEqual(len(game.current_room), 4)
+        self.assertEqual(len(game.current_room), ROOM_SIZE)
+        self.assertNotIn(None, game.current_room)
         
         # Check flags
         self.assertFalse(game.ran_last_room)
@@ -29,36 +87,35 @@ class TestGameState(unittest.TestCase):
         self.assertFalse(game.victory)
         self.assertEqual(game.cards_played_this_room, 0)
 
-    @patch('random.shuffle')
-    def test_setup_dungeon(self, mock_shuffle):
-        """Test that the dungeon is set up correctly."""
-        game = GameState()
-        
-        # The dungeon should have 40 cards (44 total - 4 in the room)
-        self.assertEqual(len(game.dungeon), 40)
-        
-        # Verify random.shuffle was called
-        mock_shuffle.assert_called_once()
+    def test_dungeon_size_invariant(self):
+        """Test that every card is either in the room or in the dungeon."""
+        game = self.game
+        
+        # A new game deals a full room from the deck
+        self.assertEqual(len(game.dungeon), DUNGEON_SIZE)
+        self.assertEqual(len(game.current_room) + len(game.dungeon), DECK_TOTAL)
+        
+        # Running moves cards between the room and the dungeon without losing any
+        game.run_from_room()
+        self.assertEqual(len(game.dungeon), DUNGEON_SIZE)
+        self.assertNotIn(None, game.current_room)
 
     def test_deal_room(self):
         """Test dealing a new room."""
-        game = GameState()
+        game = self.game
         
         # Clear the current room and dungeon
-        game.current_room = []
-        game.dungeon = [
-            Card(Suit.CLUBS, 2), Card(Suit.SPADES, 3), 
-            Card(Suit.DIAMONDS, 4), Card(Suit.HEARTS, 5)
-        ]
+        game.current_room = [None] * ROOM_SIZE
+        game.dungeon = deque(Card(suit, value) for suit, value in (
+            (Suit.CLUBS, 2), (Suit.SPADES, 3), (Suit.DIAMONDS, 4), (Suit.HEARTS, 5)
+        ))
+        dungeon_cards = list(game.dungeon)
         
         # Deal a new room
         game.deal_room()
         
-        # The room should have 4 cards
-        self.assertEqual(len(game.current_room), 4)
-        
-        # The dungeon should be empty
-        self.assertEqual(len(game.dungeon), 0)
+        # The room should hold the dungeon cards in order
+        self.assertEqual(game.current_room, dungeon_cards)
         
         # Room flags should be reset
         self.assertFalse(game.potion_used_this_room)
@@ -66,80 +123,102 @@ class TestGameState(unittest.TestCase):
 
     def test_deal_room_with_kept_card(self):
         """Test dealing a new room while keeping one card."""
-        game = GameState()
+        game = self.game
         
         # Set up a current room with one card
         kept_card = Card(Suit.DIAMONDS, 10)
-        game.current_room = [kept_card]
+        game.current_room = [kept_card, None, None, None]
         
         # Set up the dungeon with 3 cards
-        game.dungeon = [
-            Card(Suit.CLUBS, 2), Card(Suit.SPADES, 3), Card(Suit.HEARTS, 5)
-        ]
+        game.dungeon = deque(Card(suit, value) for suit, value in (
+            (Suit.CLUBS, 2), (Suit.SPADES, 3), (Suit.HEARTS, 5)
+        ))
+        dungeon_cards = list(game.dungeon)
         
         # Deal a new room
         game.deal_room()
         
-        # The room should have 4 cards
-        self.assertEqual(len(game.current_room), 4)
+        # The kept card should stay in its slot and the empty slots are filled in order
+        self.assertEqual(game.current_room, [kept_card] + dungeon_cards)
+
+    def test_deal_room_not_enough_cards(self):
+        """Test dealing a room when the dungeon runs out of cards."""
+        game = self.game
+        
+        # Only two cards left in the dungeon
+        game.current_room = [None] * ROOM_SIZE
+        game.dungeon = deque([Card(Suit.CLUBS, 2), Card(Suit.HEARTS, 5)])
         
-        # The first card should be the kept card
-        self.assertEqual(game.current_room[0], kept_card)
+        # Deal a new room
+        game.deal_room()
         
-        # The dungeon should be empty
+        # The dealt cards fill the first slots and the rest stay empty
+        self.assertEqual(game.current_room, [Card(Suit.CLUBS, 2), Card(Suit.HEARTS, 5), None, None])
         self.assertEqual(len(game.dungeon), 0)
 
-    def test_run_from_room(self):
-        """Test running from a room."""
-        game = GameState()
-        original_room = game.current_room.copy()
+    def test_play_card(self):
+        """Test playing a card from the room."""
+        game = self.game
         
-        # Run from the room
-        success = game.run_from_room()
+        # Set up a controlled room
+        monster_card = Card(Suit.CLUBS, 3)
+        weapon_card = Card(Suit.DIAMONDS, 5)
+        potion_card = Card(Suit.HEARTS, 4)
+        game.current_room = [monster_card, weapon_card, potion_card, Card(Suit.SPADES, 2)]
         
-        # Running should succeed
+        # Play the weapon card
+        message, success = game.play_card(1)
+        
+        # Should succeed
         self.assertTrue(success)
         
-        # The ran_last_room flag should be set
-        self.assertTrue(game.ran_last_room)
+        # Weapon should be equipped
+        self.assertIsNotNone(game.equipped_weapon)
+        self.assertEqual(game.equipped_weapon.card, weapon_card)
         
-        # The original room cards should be at the end of the dungeon
-        for card in original_room:
-            self.assertIn(card, game.dungeon)
+        # The played card's slot should be empty
+        self.assertIsNone(game.current_room[1])
+        self.assertEqual(len(game.current_room), ROOM_SIZE)
         
-        # A new room should be dealt
-        self.assertEqual(len(game.current_room), 4)
+        # Cards played counter should increment
+        self.assertEqual(game.cards_played_this_room, 1)
 
-    def test_run_from_room_not_allowed(self):
-        """Test running from a room when not allowed."""
-        game = GameState()
+    def test_play_card_empty_slot(self):
+        """Test that an already played slot cannot be played again."""
+        game = self.game
+        game.current_room = [Card(Suit.CLUBS, 3), None, Card(Suit.HEARTS, 4), Card(Suit.SPADES, 2)]
         
-        # Set up conditions where running is not allowed
-        game.ran_last_room = True
-        original_room = game.current_room.copy()
-        
-        # Try to run from the room
-        success = game.run_from_room()
-        
-        # Running should fail
+        # Playing the empty slot should fail without counting as a play
+        message, success = game.play_card(1)
         self.assertFalse(success)
+        self.assertEqual(game.cards_played_this_room, 0)
+
+    def test_play_card_deals_new_room(self):
+        """Test that playing the third card deals a new room around the kept card."""
+        game = self.game
         
-        # The room should remain unchanged
-        self.assertEqual(game.current_room, original_room)
-        
-        # Test when cards have been played
-        game.ran_last_room = False
-        game.cards_played_this_room = 1
-        
-        # Try to run from the room
-        success = game.run_from_room()
-        
-        # Running should fail
-        self.assertFalse(success)
+        # Set up a controlled room
+        kept_card = Card(Suit.DIAMONDS, 6)
+        game.current_room = [Card(Suit.HEARTS, 2), kept_card, Card(Suit.HEARTS, 3), Card(Suit.DIAMONDS, 4)]
+        
+        # Play every card except the one in slot 1
+        for card_index in (0, 2, 3):
+            message, success = game.play_card(card_index)
+            self.assertTrue(success)
+        
+        # The kept card stays in its slot and the others are refilled
+        self.assertIn("new room", message)
+        self.assertIs(game.current_room[1], kept_card)
+        self.assertNotIn(None, game.current_room)
+        self.assertEqual(game.cards_played_this_room, 0)
+
+
+class TestHandleMonster(GameStateTestCase):
+    """Test cases for fighting monsters."""
 
     def test_handle_monster_barehanded(self):
         """Test handling a monster encounter with no weapon."""
-        game = GameState()
+        game = self.game
         
         # Create a monster card
         monster = Card(Suit.CLUBS, 5)
@@ -147,16 +226,13 @@ class TestGameState(unittest.TestCase):
         # Handle the monster barehanded
         message = game._handle_monster(monster, use_weapon=False)
         
-        # Player should take full damage
-        self.assertEqual(game.player_health, 15)
-        
         # Message should mention fighting barehanded
-        self.assertIn("barehanded", message)
-        self.assertIn("5 damage", message)
+        missing = [f for f in ("barehanded", "5 damage") if f not in message]
+        self.assertEqual(missing, [], message)
 
     def test_handle_monster_with_weapon(self):
         """Test handling a monster encounter with a weapon."""
-        game = GameState()
+        game = self.game
         
         # Equip a weapon
         weapon_card = Card(Suit.DIAMONDS, 3)
@@ -168,19 +244,16 @@ class TestGameState(unittest.TestCase):
         # Handle the monster with weapon
         message = game._handle_monster(monster)
         
-        # Player should take reduced damage (5-3=2)
-        self.assertEqual(game.player_health, 18)
-        
         # Weapon should record last monster defeated
         self.assertEqual(game.equipped_weapon.last_monster_defeated, monster)
         
         # Message should mention the weapon
-        self.assertIn("3♦", message)
-        self.assertIn("2 damage", message)
+        missing = [f for f in ("3♦", "2 damage") if f not in message]
+        self.assertEqual(missing, [], message)
 
     def test_handle_monster_game_over(self):
         """Test handling a monster encounter that leads to game over."""
-        game = GameState()
+        game = self.game
         
         # Set player health low
         game.player_health = 5
@@ -199,9 +272,63 @@ class TestGameState(unittest.TestCase):
         # Message should mention defeat
         self.assertIn("defeated", message)
 
+    def test_handle_monster_damage(self):
+        """Test the damage taken from monsters with and without a weapon."""
+        game = self.game
+        
+        for weapon_value, monster_value, last_defeated, use_weapon, expected_damage in MONSTER_DAMAGE_CASES:
+            with self.subTest(weapon=weapon_value, monster=monster_value,
+                              last_defeated=last_defeated, use_weapon=use_weapon):
+                # Reset the player for each case
+                game.player_health = 20
+                expected_health = 20 - expected_damage
+                game.equipped_weapon = None
+                if weapon_value is not None:
+                    game.equipped_weapon = Weapon(Card(Suit.DIAMONDS, weapon_value))
+                    if last_defeated is not None:
+                        game.equipped_weapon.record_defeat(Card(Suit.CLUBS, last_defeated))
+                
+                game._handle_monster(Card(Suit.SPADES, monster_value), use_weapon=use_weapon)
+                
+                self.assertEqual(game.player_health, expected_health)
+
+    def test_handle_monster_last_monster_victory(self):
+        """Test that defeating the last monster wins the game."""
+        game = self.game
+        
+        # Only one monster left
+        game._monsters_remaining = 1
+        
+        # Defeat it barehanded
+        game._handle_monster(Card(Suit.CLUBS, 2), use_weapon=False)
+        
+        # Game should be over with victory
+        self.assertEqual(game.get_remaining_monster_count(), 0)
+        self.assertTrue(game.game_over)
+        self.assertTrue(game.victory)
+
+    def test_handle_monster_last_monster_defeat(self):
+        """Test that dying to the last monster is still a defeat."""
+        game = self.game
+        
+        # Only one monster left and low health
+        game._monsters_remaining = 1
+        game.player_health = 2
+        
+        # The monster kills the player
+        game._handle_monster(Card(Suit.SPADES, 5), use_weapon=False)
+        
+        # Game should be over without victory
+        self.assertTrue(game.game_over)
+        self.assertFalse(game.victory)
+
+
+class TestHandleWeaponPotion(GameStateTestCase):
+    """Test cases for equipping weapons and drinking potions."""
+
     def test_handle_weapon(self):
         """Test handling a weapon card."""
-        game = GameState()
+        game = self.game
         
         # Create a weapon card
         weapon_card = Card(Suit.DIAMONDS, 8)
@@ -214,12 +341,12 @@ class TestGameState(unittest.TestCase):
         self.assertEqual(game.equipped_weapon.card, weapon_card)
         
         # Message should mention equipping
-        self.assertIn("equipped", message)
-        self.assertIn("8♦", message)
+        missing = [f for f in ("equipped", "8♦") if f not in message]
+        self.assertEqual(missing, [], message)
 
     def test_handle_potion(self):
         """Test handling a potion card."""
-        game = GameState()
+        game = self.game
         
         # Set player health below max
         game.player_health = 15
@@ -236,12 +363,13 @@ class TestGameState(unittest.TestCase):
         # Potion used flag should be set
         self.assertTrue(game.potion_used_this_room)
         
-        # Message should mention healing
-        self.assertIn("healed 4", message)
+        # Message should mention the potion and healing
+        missing = [f for f in ("4♥", "healed 4") if f not in message]
+        self.assertEqual(missing, [], message)
 
     def test_handle_potion_at_max_health(self):
         """Test handling a potion card at max health."""
-        game = GameState()
+        game = self.game
         
         # Player starts at max health (20)
         
@@ -254,12 +382,13 @@ class TestGameState(unittest.TestCase):
         # Player should still be at max health
         self.assertEqual(game.player_health, 20)
         
-        # Message should mention actual healing (0)
-        self.assertIn("healed 0", message)
+        # Message should mention the potion and actual healing (0)
+        missing = [f for f in ("5♥", "healed 0") if f not in message]
+        self.assertEqual(missing, [], message)
 
     def test_handle_potion_already_used(self):
         """Test handling a potion card when already used this room."""
-        game = GameState()
+        game = self.game
         
         # Set player health below max
         game.player_health = 15
@@ -276,48 +405,76 @@ class TestGameState(unittest.TestCase):
         # Player health should not change
         self.assertEqual(game.player_health, 15)
         
-        # Message should mention no effect
-        self.assertIn("no effect", message)
+        # Message should mention the potion having no effect
+        missing = [f for f in ("3♥", "no effect") if f not in message]
+        self.assertEqual(missing, [], message)
 
-    def test_play_card(self):
-        """Test playing a card from the room."""
-        game = GameState()
-        
-        # Set up a controlled room
-        monster_card = Card(Suit.CLUBS, 3)
-        weapon_card = Card(Suit.DIAMONDS, 5)
-        potion_card = Card(Suit.HEARTS, 4)
-        game.current_room = [monster_card, weapon_card, potion_card, Card(Suit.SPADES, 2)]
+
+class TestRunAndVictory(GameStateTestCase):
+    """Test cases for running from rooms and winning the game."""
+
+    def test_run_from_room(self):
+        """Test running from a room."""
+        game = self.game
+        original_room = game.current_room.copy()
         
-        # Play the weapon card
-        message, success = game.play_card(1)
+        # Run from the room
+        success = game.run_from_room()
         
-        # Should succeed
+        # Running should succeed
         self.assertTrue(success)
         
-        # Weapon should be equipped
-        self.assertIsNotNone(game.equipped_weapon)
-        self.assertEqual(game.equipped_weapon.card, weapon_card)
+        # The ran_last_room flag should be set
+        self.assertTrue(game.ran_last_room)
         
-        # Room should have one less card
-        self.assertEqual(len(game.current_room), 3)
+        # The original room cards should be back in the dungeon (the same instances)
+        original_ids = {id(card) for card in original_room}
+        dungeon_ids = {id(card) for card in game.dungeon}
+        self.assertTrue(original_ids.issubset(dungeon_ids))
         
-        # Cards played counter should increment
-        self.assertEqual(game.cards_played_this_room, 1)
+        # A new room should be dealt
+        self.assertNotIn(None, game.current_room)
+
+    def test_run_from_room_not_allowed(self):
+        """Test running from a room when not allowed."""
+        game = self.game
+        
+        # Set up conditions where running is not allowed
+        game.ran_last_room = True
+        original_room = game.current_room
+        dungeon_size = len(game.dungeon)
+        
+        # Try to run from the room
+        success = game.run_from_room()
+        
+        # Running should fail
+        self.assertFalse(success)
+        
+        # The room should be left untouched and no cards returned to the dungeon
+        self.assertIs(game.current_room, original_room)
+        self.assertNotIn(None, game.current_room)
+        self.assertEqual(len(game.dungeon), dungeon_size)
+        
+        # Test when cards have been played
+        game.ran_last_room = False
+        game.cards_played_this_room = 1
+        
+        # Try to run from the room
+        success = game.run_from_room()
+        
+        # Running should fail
+        self.assertFalse(success)
 
     def test_check_victory(self):
         """Test the victory condition check."""
-        game = GameState()
+        game = self.game
+        
+        # Monsters remain, so there is no victory yet
+        game._check_victory()
+        self.assertFalse(game.game_over)
         
-        # Set up a state with no monster cards left
-        game.dungeon = [
-            Card(Suit.DIAMONDS, 2), Card(Suit.DIAMONDS, 3), 
-            Card(Suit.HEARTS, 4), Card(Suit.HEARTS, 5)
-        ]
-        game.current_room = [
-            Card(Suit.DIAMONDS, 6), Card(Suit.DIAMONDS, 7), 
-            Card(Suit.HEARTS, 8), Card(Suit.HEARTS, 9)
-        ]
+        # No monster cards left
+        game._monsters_remaining = 0
         
         # Check for victory
         game._check_victory()
@@ -328,23 +485,34 @@ class TestGameState(unittest.TestCase):
 
     def test_get_remaining_monster_count(self):
         """Test counting remaining monsters."""
-        game = GameState()
-        
-        # Set up a controlled state
-        game.dungeon = [
-            Card(Suit.CLUBS, 2), Card(Suit.SPADES, 3), 
-            Card(Suit.DIAMONDS, 4), Card(Suit.HEARTS, 5)
-        ]
-        game.current_room = [
-            Card(Suit.CLUBS, 6), Card(Suit.DIAMONDS, 7), 
-            Card(Suit.HEARTS, 8), Card(Suit.SPADES, 9)
-        ]
-        
-        # Count monsters
-        count = game.get_remaining_monster_count()
-        
-        # Should be 4 monsters (2 in dungeon, 2 in room)
-        self.assertEqual(count, 4)
+        # (monsters fought, expected count); a fresh game has all 26 clubs and spades
+        for monsters_fought, expected in [(0, 26), (1, 25), (26, 0)]:
+            with self.subTest(monsters_fought=monsters_fought):
+                game = copy.deepcopy(self._template)
+                
+                # Enough health to survive every fight (26 x 2 damage)
+                game.player_health = 100
+                for _ in range(monsters_fought):
+                    game._handle_monster(Card(Suit.CLUBS, 2), use_weapon=False)
+                
+                self.assertGreater(game.player_health, 0)
+                self.assertEqual(game.get_remaining_monster_count(), expected)
+                
+                # Defeating the last monster is what wins the game
+                self.assertEqual(game.victory, expected == 0)
+
+    def test_get_remaining_monster_count_other_actions(self):
+        """Test that only fighting monsters changes the monster count."""
+        game = self.game
+        
+        # Weapons and potions don't affect the count
+        game._handle_weapon(Card(Suit.DIAMONDS, 4))
+        game._handle_potion(Card(Suit.HEARTS, 5))
+        self.assertEqual(game.get_remaining_monster_count(), 26)
+        
+        # Running puts the monsters back into the dungeon, so the count is unchanged
+        game.run_from_room()
+        self.assertEqual(game.get_remaining_monster_count(), 26)
 
 
 if __name__ == '__main__':